@@ -1,3 +1,6 @@
+from functools import lru_cache
+from types import MappingProxyType
+
 from ddtrace import config
 from ddtrace.constants import _SPAN_MEASURED_KEY
 from ddtrace.constants import SPAN_KIND
@@ -51,6 +54,24 @@ class Psycopg2TracedConnection(dbapi.TracedConnection):
         super(Psycopg2TracedConnection, self).__init__(conn, pin, config.psycopg, cursor_cls=cursor_cls)
 
 
+@lru_cache(maxsize=64)
+def _dsn_tags(parser, dsn):
+    # Pooled connections share the same DSN, so only parse it and build its tags once per parser implementation
+    parsed = parser(dsn)
+    host = parsed.get("host")
+    return MappingProxyType(
+        {
+            net.TARGET_HOST: host,
+            net.TARGET_PORT: parsed.get("port", 5432),
+            net.SERVER_ADDRESS: host,
+            db.NAME: parsed.get("dbname"),
+            db.USER: parsed.get("user"),
+            "db.application": parsed.get("application_name"),
+            db.SYSTEM: "postgresql",
+        }
+    )
+
+
 def patch_conn(conn, traced_conn_cls, pin=None):
     """Wrap will patch the instance so that its queries are traced."""
     # ensure we've patched extensions (this is idempotent) in
@@ -66,20 +87,11 @@ def patch_conn(conn, traced_conn_cls, pin=None):
 
     # if the connection has an info attr, we are using psycopg3
     if hasattr(conn, "dsn"):
-        dsn = sql.parse_pg_dsn(conn.dsn)
+        tags = _dsn_tags(sql.parse_pg_dsn, conn.dsn)
     else:
-        dsn = sql.parse_pg_dsn(conn.info.dsn)
-
-    tags = {
-        net.TARGET_HOST: dsn.get("host"),
-        net.TARGET_PORT: dsn.get("port", 5432),
-        net.SERVER_ADDRESS: dsn.get("host"),
-        db.NAME: dsn.get("dbname"),
-        db.USER: dsn.get("user"),
-        "db.application": dsn.get("application_name"),
-        db.SYSTEM: "postgresql",
-    }
-    Pin(tags=tags, _config=_config).onto(c)
+        tags = _dsn_tags(sql.parse_pg_dsn, conn.info.dsn)
+
+    Pin(tags=dict(tags), _config=_config).onto(c)
     return c
 
 
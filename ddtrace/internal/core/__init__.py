@@ -101,7 +101,6 @@ like this::
 The names of these events follow the pattern ``context.[started|ended].<context_name>``.
 """
 
-from contextlib import AbstractContextManager
 import logging
 import sys
 import types
@@ -110,13 +109,18 @@ from typing import Any  # noqa:F401
 from typing import Dict  # noqa:F401
 from typing import List  # noqa:F401
 from typing import Optional  # noqa:F401
+from typing import Tuple  # noqa:F401
 
 from ddtrace.vendor.debtcollector import deprecate
 
 from ..utils.deprecations import DDTraceDeprecationWarning
 from . import event_hub  # noqa:F401
+from ._context import ROOT_CONTEXT_ID
+from ._context import BaseExecutionContext
 from .event_hub import EventResultDict  # noqa:F401
+from .event_hub import _has_hooks
 from .event_hub import dispatch
+from .event_hub import dispatch_many
 from .event_hub import dispatch_with_results  # noqa:F401
 from .event_hub import has_listeners  # noqa:F401
 from .event_hub import on  # noqa:F401
@@ -134,7 +138,6 @@ tracer = None
 log = logging.getLogger(__name__)
 
 
-ROOT_CONTEXT_ID = "__root"
 SPAN_DEPRECATION_MESSAGE = (
     "The 'span' keyword argument on ExecutionContext methods is deprecated and will be removed in a future version."
 )
@@ -142,15 +145,45 @@ SPAN_DEPRECATION_SUGGESTION = (
     "Please store contextual data on the ExecutionContext object using other kwargs and/or set_item()"
 )
 DEPRECATION_MEMO = set()
+# Some identifiers are generated dynamically (e.g. one per test), so bound the cache size
+_EVENT_NAME_CACHE_MAX_SIZE = 1024
+_EVENT_NAME_CACHE: Dict[str, Tuple[Tuple[str, str], str]] = {}
+
+
+def _event_names(identifier: str) -> Tuple[Tuple[str, str], str]:
+    """Return the (started, start_span) and ended event names for a context identifier"""
+    names = _EVENT_NAME_CACHE.get(identifier)
+    if names is None:
+        names = (
+            (
+                sys.intern("context.started." + identifier),
+                sys.intern("context.started.start_span." + identifier),
+            ),
+            sys.intern("context.ended." + identifier),
+        )
+        if len(_EVENT_NAME_CACHE) < _EVENT_NAME_CACHE_MAX_SIZE:
+            _EVENT_NAME_CACHE[identifier] = names
+    return names
+
+
+_FASTAPI_MODULES = ("fastapi", "fastapi.applications")
+_fastapi_loaded = False
+
+
+def _is_fastapi_loaded() -> bool:
+    # Modules are not expected to be unloaded, so stop looking in sys.modules once fastapi has been seen
+    global _fastapi_loaded
+    if not _fastapi_loaded:
+        _fastapi_loaded = any(name in sys.modules for name in _FASTAPI_MODULES)
+    return _fastapi_loaded
 
 
 def _deprecate_span_kwarg(span):
+    # DEV: callers only call this when span is not None to keep the common path cheap
     if (
-        span is not None
-        and id(_CURRENT_CONTEXT) not in DEPRECATION_MEMO
+        id(_CURRENT_CONTEXT) not in DEPRECATION_MEMO
         # https://github.com/tiangolo/fastapi/pull/10876
-        and "fastapi" not in sys.modules
-        and "fastapi.applications" not in sys.modules
+        and not _is_fastapi_loaded()
     ):
         DEPRECATION_MEMO.add(id(_CURRENT_CONTEXT))
         deprecate(
@@ -160,46 +193,40 @@ def _deprecate_span_kwarg(span):
         )
 
 
-class ExecutionContext(AbstractContextManager):
+class ExecutionContext(BaseExecutionContext):
+    __slots__ = ()
+
     def __init__(
         self, identifier: str, parent: Optional["ExecutionContext"] = None, span: Optional["Span"] = None, **kwargs
     ) -> None:
-        _deprecate_span_kwarg(span)
-        self.identifier: str = identifier
-        self._data: Dict[str, Any] = {}
-        self._span: Optional["Span"] = span
-        self._suppress_exceptions: List[type] = []
-        self._data.update(kwargs)
-        self._parent: Optional["ExecutionContext"] = parent
-        self._inner_span: Optional["Span"] = None
+        if span is not None:
+            _deprecate_span_kwarg(span)
+        self.identifier = identifier
+        if kwargs:
+            self._data = kwargs
+        self._span = span
+        self._parent = parent
 
     def __enter__(self) -> "ExecutionContext":
-        if self._span is None and "_CURRENT_CONTEXT" in globals():
-            self._token: contextvars.Token["ExecutionContext"] = _CURRENT_CONTEXT.set(self)
-        dispatch("context.started.%s" % self.identifier, (self,))
-        dispatch("context.started.start_span.%s" % self.identifier, (self,))
+        if self._span is None:
+            self._token = _CURRENT_CONTEXT.set(self)
+        started = _event_names(self.identifier)[0]
+        if _has_hooks(started[0]) or _has_hooks(started[1]):
+            dispatch_many(started, (self,))
         return self
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__} '{self.identifier}' @ {id(self)}"
 
-    @property
-    def parent(self) -> Optional["ExecutionContext"]:
-        return self._parent
-
-    @parent.setter
-    def parent(self, value: "ExecutionContext") -> None:
-        if self._parent is not None:
-            raise ValueError("Cannot overwrite ExecutionContext parent")
-        self._parent = value
-
     def __exit__(
         self, exc_type: Optional[type], exc_value: Optional[BaseException], traceback: Optional[types.TracebackType]
     ) -> bool:
-        dispatch("context.ended.%s" % self.identifier, (self,))
+        ended = _event_names(self.identifier)[1]
+        if _has_hooks(ended):
+            dispatch(ended, (self,))
         if self._span is None:
             try:
-                if hasattr(self, "_token"):
+                if self._token is not None:
                     _CURRENT_CONTEXT.reset(self._token)
             except ValueError:
                 log.debug(
@@ -211,8 +238,9 @@ class ExecutionContext(AbstractContextManager):
                 log.debug(
                     "Encountered LookupError during core contextvar reset() call. I don't know why this is possible."
                 )
-        if id(self) in DEPRECATION_MEMO:
-            DEPRECATION_MEMO.remove(id(self))
+        else:
+            # DEV: only contexts created with the deprecated span kwarg can have touched the memo
+            DEPRECATION_MEMO.discard(id(self))
 
         return (
             True
@@ -220,59 +248,6 @@ class ExecutionContext(AbstractContextManager):
             else any(issubclass(exc_type, exc_type_) for exc_type_ in self._suppress_exceptions)
         )
 
-    def get_item(self, data_key: str, default: Optional[Any] = None) -> Any:
-        # NB mimic the behavior of `ddtrace.internal._context` by doing lazy inheritance
-        current: Optional[ExecutionContext] = self
-        while current is not None:
-            if data_key in current._data:
-                return current._data.get(data_key)
-            current = current.parent
-        return default
-
-    def get_local_item(self, data_key: str, default: Optional[Any] = None) -> Any:
-        return self._data.get(data_key, default)
-
-    def __getitem__(self, key: str):
-        value = self.get_item(key)
-        if value is None and key not in self._data:
-            raise KeyError
-        return value
-
-    def get_items(self, data_keys: List[str]) -> List[Optional[Any]]:
-        return [self.get_item(key) for key in data_keys]
-
-    def set_item(self, data_key: str, data_value: Optional[Any]) -> None:
-        self._data[data_key] = data_value
-
-    def set_safe(self, data_key: str, data_value: Optional[Any]) -> None:
-        if data_key in self._data:
-            raise ValueError("Cannot overwrite ExecutionContext data key '%s'", data_key)
-        return self.set_item(data_key, data_value)
-
-    def set_items(self, keys_values: Dict[str, Optional[Any]]) -> None:
-        for data_key, data_value in keys_values.items():
-            self.set_item(data_key, data_value)
-
-    def discard_item(self, data_key: str) -> None:
-        # NB mimic the behavior of `ddtrace.internal._context` by doing lazy inheritance
-        current: Optional[ExecutionContext] = self
-        while current is not None:
-            if data_key in current._data:
-                del current._data[data_key]
-                return
-            current = current.parent
-
-    def discard_local_item(self, data_key: str) -> None:
-        self._data.pop(data_key, None)
-
-    def root(self):
-        if self.identifier == ROOT_CONTEXT_ID:
-            return self
-        current = self
-        while current.parent is not None:
-            current = current.parent
-        return current
-
     @property
     def span(self) -> "Span":
         if self._inner_span is None:
@@ -306,17 +281,21 @@ def _reset_context():
 
 
 def context_with_data(identifier, parent=None, **kwargs):
-    return _CONTEXT_CLASS(identifier, parent=(parent or _CURRENT_CONTEXT.get()), **kwargs)
+    if "span" in kwargs:
+        return _CONTEXT_CLASS(identifier, parent=(parent or _CURRENT_CONTEXT.get()), **kwargs)
+    # kwargs is a fresh dict owned by this call, so the context can use it as its data directly
+    return _CONTEXT_CLASS._from_data(identifier, parent or _CURRENT_CONTEXT.get(), kwargs)
 
 
 def add_suppress_exception(exc_type: type) -> None:
-    _CURRENT_CONTEXT.get()._suppress_exceptions.append(exc_type)
+    _CURRENT_CONTEXT.get()._suppress_exceptions += (exc_type,)
 
 
 def get_item(data_key: str, span: Optional["Span"] = None) -> Any:
-    _deprecate_span_kwarg(span)
-    if span is not None and span._local_root is not None:
-        return span._local_root._get_ctx_item(data_key)
+    if span is not None:
+        _deprecate_span_kwarg(span)
+        if span._local_root is not None:
+            return span._local_root._get_ctx_item(data_key)
     return _CURRENT_CONTEXT.get().get_item(data_key)
 
 
@@ -325,9 +304,10 @@ def get_local_item(data_key: str, span: Optional["Span"] = None) -> Any:
 
 
 def get_items(data_keys: List[str], span: Optional["Span"] = None) -> List[Optional[Any]]:
-    _deprecate_span_kwarg(span)
-    if span is not None and span._local_root is not None:
-        return [span._local_root._get_ctx_item(key) for key in data_keys]
+    if span is not None:
+        _deprecate_span_kwarg(span)
+        if span._local_root is not None:
+            return [span._local_root._get_ctx_item(key) for key in data_keys]
     return _CURRENT_CONTEXT.get().get_items(data_keys)
 
 
@@ -337,19 +317,21 @@ def set_safe(data_key: str, data_value: Optional[Any]) -> None:
 
 # NB Don't call these set_* functions from `ddtrace.contrib`, only from product code!
 def set_item(data_key: str, data_value: Optional[Any], span: Optional["Span"] = None) -> None:
-    _deprecate_span_kwarg(span)
-    if span is not None and span._local_root is not None:
-        span._local_root._set_ctx_item(data_key, data_value)
-    else:
-        _CURRENT_CONTEXT.get().set_item(data_key, data_value)
+    if span is not None:
+        _deprecate_span_kwarg(span)
+        if span._local_root is not None:
+            span._local_root._set_ctx_item(data_key, data_value)
+            return
+    _CURRENT_CONTEXT.get().set_item(data_key, data_value)
 
 
 def set_items(keys_values: Dict[str, Optional[Any]], span: Optional["Span"] = None) -> None:
-    _deprecate_span_kwarg(span)
-    if span is not None and span._local_root is not None:
-        span._local_root._set_ctx_items(keys_values)
-    else:
-        _CURRENT_CONTEXT.get().set_items(keys_values)
+    if span is not None:
+        _deprecate_span_kwarg(span)
+        if span._local_root is not None:
+            span._local_root._set_ctx_items(keys_values)
+            return
+    _CURRENT_CONTEXT.get().set_items(keys_values)
 
 
 def discard_item(data_key: str) -> None:
@@ -361,11 +343,12 @@ def discard_local_item(data_key: str) -> None:
 
 
 def get_span() -> Optional["Span"]:
-    current: Optional[ExecutionContext] = _CURRENT_CONTEXT.get()
+    current: Optional[BaseExecutionContext] = _CURRENT_CONTEXT.get()
     while current is not None:
-        if current._inner_span is not None:
-            return current._inner_span
-        current = current.parent
+        span = current._inner_span
+        if span is not None:
+            return span
+        current = current._parent
     return None
 
 
@@ -0,0 +1,39 @@
+import contextvars
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import TypeVar
+
+ROOT_CONTEXT_ID: str
+
+_C = TypeVar("_C", bound="BaseExecutionContext")
+
+class BaseExecutionContext:
+    identifier: str
+    _data: Dict[str, Any]
+    _span: Optional[Any]
+    _suppress_exceptions: Tuple[type, ...]
+    _parent: Optional["BaseExecutionContext"]
+    _inner_span: Optional[Any]
+    _token: Optional[contextvars.Token]
+    @classmethod
+    def _from_data(
+        cls: Type[_C], identifier: str, parent: Optional["BaseExecutionContext"], data: Dict[str, Any]
+    ) -> _C: ...
+    @property
+    def parent(self) -> Optional["BaseExecutionContext"]: ...
+    @parent.setter
+    def parent(self, value: "BaseExecutionContext") -> None: ...
+    def get_item(self, data_key: str, default: Optional[Any] = None) -> Any: ...
+    def get_local_item(self, data_key: str, default: Optional[Any] = None) -> Any: ...
+    def __getitem__(self, key: str) -> Any: ...
+    def get_items(self, data_keys: List[str]) -> List[Optional[Any]]: ...
+    def set_item(self, data_key: str, data_value: Optional[Any]) -> None: ...
+    def set_safe(self, data_key: str, data_value: Optional[Any]) -> None: ...
+    def set_items(self, keys_values: Dict[str, Optional[Any]]) -> None: ...
+    def discard_item(self, data_key: str) -> None: ...
+    def discard_local_item(self, data_key: str) -> None: ...
+    def root(self) -> "BaseExecutionContext": ...
@@ -0,0 +1,111 @@
+"""Compiled data container for ``ExecutionContext``.
+
+The lookups and updates of context data run on every integration call, so they are implemented here to
+avoid interpreter overhead on attribute access and on walking up the context tree. The context manager
+protocol and event dispatching stay in ``ddtrace.internal.core``, which owns the current context variable.
+"""
+from types import MappingProxyType
+
+
+ROOT_CONTEXT_ID = "__root"
+
+cdef object _MISSING = object()
+
+# Shared read-only placeholder for contexts that hold no data yet, replaced by a dict on first write
+_EMPTY_DATA = MappingProxyType({})
+cdef object _empty_data = _EMPTY_DATA
+
+
+cdef class BaseExecutionContext:
+    cdef public object identifier
+    cdef public object _data
+    cdef public object _span
+    cdef public tuple _suppress_exceptions
+    cdef public BaseExecutionContext _parent
+    cdef public object _inner_span
+    cdef public object _token
+    cdef object __weakref__
+
+    def __cinit__(self, *args, **kwargs):
+        self._data = _empty_data
+        self._suppress_exceptions = ()
+
+    @classmethod
+    def _from_data(cls, identifier, BaseExecutionContext parent, data):
+        """Create a context that takes ownership of ``data`` instead of copying it into a new dict"""
+        cdef BaseExecutionContext self = cls.__new__(cls)
+        self.identifier = identifier
+        if data:
+            self._data = data
+        self._parent = parent
+        return self
+
+    @property
+    def parent(self):
+        return self._parent
+
+    @parent.setter
+    def parent(self, BaseExecutionContext value):
+        if self._parent is not None:
+            raise ValueError("Cannot overwrite ExecutionContext parent")
+        self._parent = value
+
+    cdef object _get_item(self, object data_key, object default):
+        # NB mimic the behavior of `ddtrace.internal._context` by doing lazy inheritance
+        cdef BaseExecutionContext current = self
+        while current is not None:
+            value = current._data.get(data_key, _MISSING)
+            if value is not _MISSING:
+                return value
+            current = current._parent
+        return default
+
+    def get_item(self, data_key, default=None):
+        return self._get_item(data_key, default)
+
+    def get_local_item(self, data_key, default=None):
+        return self._data.get(data_key, default)
+
+    def __getitem__(self, key):
+        value = self.get_item(key)
+        if value is None and key not in self._data:
+            raise KeyError
+        return value
+
+    def get_items(self, data_keys):
+        return [self._get_item(key, None) for key in data_keys]
+
+    def set_item(self, data_key, data_value):
+        if self._data is _empty_data:
+            self._data = {}
+        self._data[data_key] = data_value
+
+    def set_safe(self, data_key, data_value):
+        if data_key in self._data:
+            raise ValueError("Cannot overwrite ExecutionContext data key '%s'", data_key)
+        return self.set_item(data_key, data_value)
+
+    def set_items(self, keys_values):
+        for data_key, data_value in keys_values.items():
+            self.set_item(data_key, data_value)
+
+    def discard_item(self, data_key):
+        # NB mimic the behavior of `ddtrace.internal._context` by doing lazy inheritance
+        cdef BaseExecutionContext current = self
+        while current is not None:
+            if data_key in current._data:
+                del current._data[data_key]
+                return
+            current = current._parent
+
+    def discard_local_item(self, data_key):
+        if self._data is not _empty_data:
+            self._data.pop(data_key, None)
+
+    def root(self):
+        cdef BaseExecutionContext current = self
+        if self.identifier == ROOT_CONTEXT_ID:
+            return self
+        while current._parent is not None:
+            current = current._parent
+        return current
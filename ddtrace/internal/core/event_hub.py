@@ -51,6 +51,11 @@ def has_listeners(event_id: str) -> bool:
     return bool(_listeners.get(event_id))
 
 
+def _has_hooks(event_id: str) -> bool:
+    """Check if dispatching the provided event_id would call any hook, including the ones registered with on_all"""
+    return bool(_all_listeners) or bool(_listeners.get(event_id))
+
+
 def on(event_id: str, callback: Callable[..., Any], name: Any = None) -> None:
     """Register a listener for the provided event_id"""
     global _listeners
@@ -111,6 +116,12 @@ def dispatch(event_id: str, args: Tuple[Any, ...] = ()) -> None:
                 raise
 
 
+def dispatch_many(event_ids: Tuple[str, ...], args: Tuple[Any, ...] = ()) -> None:
+    """Call all hooks for each of the provided event_ids, in order, with the same provided args"""
+    for event_id in event_ids:
+        dispatch(event_id, args)
+
+
 def dispatch_with_results(event_id: str, args: Tuple[Any, ...] = ()) -> EventResultDict:
     """Call all hooks for the provided event_id with the provided args
     returning the results and exceptions from the called hooks
@@ -1,9 +1,9 @@
+from itertools import repeat
 import sys
 from typing import Any  # noqa:F401
 from typing import Iterator  # noqa:F401
 from typing import List  # noqa:F401
 from typing import Optional  # noqa:F401
-from typing import Set  # noqa:F401
 from typing import Tuple  # noqa:F401
 from typing import Type  # noqa:F401
 from typing import Union  # noqa:F401
@@ -16,6 +16,8 @@ from ddtrace.internal.utils.cache import cached
 
 NoneType = type(None)
 
+_SCALAR_TYPES = frozenset({str, int, float, bool, NoneType, bytes, complex})
+
 PY = sys.version_info
 
 
@@ -32,12 +34,13 @@ def _maybe_slots(obj):
 
 @cached()
 def _slots(_type):
-    # type: (Type) -> Set[str]
-    return {_ for cls in object.__getattribute__(_type, "__mro__") for _ in _maybe_slots(cls)}
+    # type: (Type) -> Tuple[str, ...]
+    # DEV: Use a dict to deduplicate the names while keeping the MRO order
+    return tuple(dict.fromkeys(_ for cls in object.__getattribute__(_type, "__mro__") for _ in _maybe_slots(cls)))
 
 
 def get_slots(obj):
-    # type: (Any) -> Set[str]
+    # type: (Any) -> Tuple[str, ...]
     """Get the object's slots."""
     return _slots(type(obj))
 
@@ -84,13 +87,12 @@ class SafeObjectProxy(wrapt.ObjectProxy):
 
     def __iter__(self):
         # type: () -> Any
-        return iter(type(self).safe(_) for _ in super(SafeObjectProxy, self).__iter__())
+        return map(type(self).safe, super(SafeObjectProxy, self).__iter__())
 
     def items(self):
         # type: () -> Iterator[Tuple[Any, Any]]
-        return (
-            (type(self).safe(k), type(self).safe(v)) for k, v in super(SafeObjectProxy, self).__getattr__("items")()
-        )
+        safe = type(self).safe
+        return ((safe(k), safe(v)) for k, v in super(SafeObjectProxy, self).__getattr__("items")())
 
     # Custom object representations might cause side-effects
     def __str__(self):
@@ -104,6 +106,10 @@ class SafeObjectProxy(wrapt.ObjectProxy):
         """Turn an object into a safe proxy."""
         _type = type(obj)
 
+        if _type in _SCALAR_TYPES:
+            # We are assuming that scalar builtin type instances are safe
+            return obj
+
         if _isinstance(obj, type):
             try:
                 if obj.__module__ == "builtins":
@@ -113,18 +119,18 @@ class SafeObjectProxy(wrapt.ObjectProxy):
                 # No __module__ attribute. We'll use caution
                 pass
 
-        elif _type in {str, int, float, bool, NoneType, bytes, complex}:
-            # We are assuming that scalar builtin type instances are safe
-            return obj
+        _getattribute = object.__getattribute__
 
         try:
-            return cls(AttrDict(object.__getattribute__(obj, "__dict__")))
+            return cls(AttrDict(_getattribute(obj, "__dict__")))
         except AttributeError:
             pass
 
         slots = get_slots(obj)
         if slots:
             # Handle slots objects
-            return cls(AttrDict({k: object.__getattribute__(obj, k) for k in slots}))
+            # DEV: attrgetter would go through the type's __getattribute__, which
+            # could cause side effects, so map object.__getattribute__ instead.
+            return cls(AttrDict(zip(slots, map(_getattribute, repeat(obj, len(slots)), slots))))
 
         return cls(obj)
@@ -30,12 +30,36 @@ class EvaluatorRunnerSamplingRule(SamplingRule):
         super(EvaluatorRunnerSamplingRule, self).__init__(sample_rate)
         self.evaluator_label = evaluator_label
         self.span_name = span_name
+        # The patterns are fixed for the lifetime of the rule, so specialize matches for the ones that are set.
+        # Reassigning evaluator_label or span_name afterwards does not change what the rule matches.
+        self.matches = self._build_matcher(evaluator_label, span_name)  # type: ignore[method-assign]
+
+    def _build_matcher(self, label_pattern, span_name_pattern):
+        if label_pattern is self.NO_RULE and span_name_pattern is self.NO_RULE:
+
+            def matches(evaluator_label, span_name):
+                return True
+
+        elif label_pattern is self.NO_RULE:
+
+            def matches(evaluator_label, span_name):
+                return span_name == span_name_pattern
+
+        elif span_name_pattern is self.NO_RULE:
+
+            def matches(evaluator_label, span_name):
+                return evaluator_label == label_pattern
+
+        else:
+
+            def matches(evaluator_label, span_name):
+                return span_name == span_name_pattern and evaluator_label == label_pattern
+
+        return matches
 
     def matches(self, evaluator_label, span_name):
-        for prop, pattern in [(span_name, self.span_name), (evaluator_label, self.evaluator_label)]:
-            if pattern != self.NO_RULE and prop != pattern:
-                return False
-        return True
+        # DEV: instances shadow this with the matcher built in __init__; this is only reached through the class
+        return self._build_matcher(self.evaluator_label, self.span_name)(evaluator_label, span_name)
 
     def __repr__(self):
         return "EvaluatorRunnerSamplingRule(sample_rate={}, evaluator_label={}, span_name={})".format(
@@ -52,8 +76,9 @@ class EvaluatorRunnerSampler:
         self.rules = self.parse_rules()
 
     def sample(self, evaluator_label, span):
+        span_name = span.name
         for rule in self.rules:
-            if rule.matches(evaluator_label=evaluator_label, span_name=span.name):
+            if rule.matches(evaluator_label, span_name):
                 return rule.sample(span)
         return True
 
@@ -91,19 +116,23 @@ class EvaluatorRunnerSampler:
             parsing_failed_because("Evaluator sampling rules must be a list of dictionaries", ValueError)
             return []
 
+        no_rule = SamplingRule.NO_RULE
+        sample_rate_key = EvaluatorRunnerSamplingRule.SAMPLE_RATE_KEY
+        span_name_key = EvaluatorRunnerSamplingRule.SPAN_NAME_KEY
+        evaluator_label_key = EvaluatorRunnerSamplingRule.EVALUATOR_LABEL_KEY
         for rule in json_rules:
-            if "sample_rate" not in rule:
+            if sample_rate_key not in rule:
                 parsing_failed_because(
                     "No sample_rate provided for sampling rule: {}".format(json.dumps(rule)), KeyError
                 )
                 continue
             try:
-                sample_rate = float(rule[EvaluatorRunnerSamplingRule.SAMPLE_RATE_KEY])
-            except ValueError:
+                sample_rate = float(rule[sample_rate_key])
+            except (TypeError, ValueError):
                 parsing_failed_because("sample_rate is not a float for rule: {}".format(json.dumps(rule)), KeyError)
                 continue
-            span_name = rule.get(EvaluatorRunnerSamplingRule.SPAN_NAME_KEY, SamplingRule.NO_RULE)
-            evaluator_label = rule.get(EvaluatorRunnerSamplingRule.EVALUATOR_LABEL_KEY, SamplingRule.NO_RULE)
+            span_name = rule.get(span_name_key, no_rule)
+            evaluator_label = rule.get(evaluator_label_key, no_rule)
             telemetry_writer.add_distribution_metric(
                 TELEMETRY_NAMESPACE.MLOBS,
                 "evaluators.rule_sample_rate",
@@ -731,6 +731,11 @@ setup(
                     sources=["ddtrace/internal/_tagset.pyx"],
                     language="c",
                 ),
+                Cython.Distutils.Extension(
+                    "ddtrace.internal.core._context",
+                    sources=["ddtrace/internal/core/_context.pyx"],
+                    language="c",
+                ),
                 Extension(
                     "ddtrace.internal._encoding",
                     ["ddtrace/internal/_encoding.pyx"],
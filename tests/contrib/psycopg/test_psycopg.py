@@ -8,8 +8,10 @@ from psycopg.sql import Composed
 from psycopg.sql import Identifier
 from psycopg.sql import Literal
 
+from ddtrace.contrib.internal.psycopg.connection import patch_conn
 from ddtrace.contrib.internal.psycopg.patch import patch
 from ddtrace.contrib.internal.psycopg.patch import unpatch
+from ddtrace.ext import sql
 from ddtrace.internal.schema import DEFAULT_SPAN_SERVICE_NAME
 from ddtrace.internal.utils.version import parse_version
 from ddtrace.trace import Pin
@@ -536,3 +538,39 @@ class PsycopgCore(TracerTestCase):
 
         query_span = spans[0]
         assert query_span.name == "postgres.query"
+
+
+class _FakeConnection(object):
+    def __init__(self, dsn):
+        self.info = mock.Mock(dsn=dsn)
+
+
+def _patch_fake_connection(dsn):
+    return patch_conn(_FakeConnection(dsn), traced_conn_cls=lambda conn: conn)
+
+
+def test_patch_conn_same_dsn_tags_are_not_shared():
+    dsn = "host=localhost port=5432 dbname=postgres user=postgres application_name=dd-test-tags"
+    pin_a = Pin.get_from(_patch_fake_connection(dsn))
+    pin_b = Pin.get_from(_patch_fake_connection(dsn))
+
+    assert pin_a.tags == pin_b.tags
+    assert pin_a.tags["out.host"] == "localhost"
+    assert pin_a.tags["db.application"] == "dd-test-tags"
+    assert pin_a.tags is not pin_b.tags
+    assert type(pin_a.tags) is dict
+
+    pin_a.tags["out.host"] = "mutated"
+    assert Pin.get_from(_patch_fake_connection(dsn)).tags["out.host"] == "localhost"
+    assert pin_b.tags["out.host"] == "localhost"
+
+
+def test_patch_conn_dsn_parser_swap_is_not_stale():
+    dsn = "host=localhost port=5432 dbname=postgres user=postgres application_name=dd-test-parser-swap"
+    with mock.patch.object(sql, "parse_pg_dsn", sql._dd_parse_pg_dsn):
+        assert Pin.get_from(_patch_fake_connection(dsn)).tags["out.host"] == "localhost"
+
+    other_parser = mock.Mock(return_value={"host": "other-host"})
+    with mock.patch.object(sql, "parse_pg_dsn", other_parser):
+        assert Pin.get_from(_patch_fake_connection(dsn)).tags["out.host"] == "other-host"
+    other_parser.assert_called_once_with(dsn)
@@ -3,6 +3,7 @@ from time import sleep
 from typing import Any
 from typing import List
 import unittest
+import weakref
 
 import mock
 import pytest
@@ -213,6 +214,23 @@ class TestContextEventsApi(unittest.TestCase):
             ("context.ended.my.cool.context", (ctx,)),
         ]
 
+    def test_core_dispatch_many(self):
+        calls = []
+
+        core.event_hub.on_all(lambda event_id, args: calls.append(("all", event_id, args)))
+        core.on("event.1", lambda *args: calls.append(("event.1", args)))
+        core.on("event.3", lambda *args: calls.append(("event.3", args)))
+
+        core.event_hub.dispatch_many(("event.1", "event.2", "event.3"), (1, 2))
+
+        assert calls == [
+            ("all", "event.1", (1, 2)),
+            ("event.1", (1, 2)),
+            ("all", "event.2", (1, 2)),
+            ("all", "event.3", (1, 2)),
+            ("event.3", (1, 2)),
+        ]
+
     @with_config_raise_value(raise_value=False)
     def test_core_dispatch_exceptions_no_raise(self):
         def on_exception(*_):
@@ -329,6 +347,15 @@ class TestContextEventsApi(unittest.TestCase):
             pass
         assert handler.called
 
+    def test_core_context_no_listeners_skips_dispatch(self):
+        with mock.patch("ddtrace.internal.core.dispatch") as dispatch, mock.patch(
+            "ddtrace.internal.core.dispatch_many"
+        ) as dispatch_many:
+            with core.context_with_data("my.cool.context"):
+                pass
+        assert not dispatch.called
+        assert not dispatch_many.called
+
     def test_core_root_context(self):
         root_context = core._CURRENT_CONTEXT.get()
         assert isinstance(root_context, core.ExecutionContext)
@@ -357,6 +384,36 @@ class TestContextEventsApi(unittest.TestCase):
             assert core.get_item(data_key) == data_value
         assert core.get_item(data_key) is None
 
+    def test_core_empty_context_data(self):
+        data_key = "my.cool.data"
+        with core.context_with_data("foobar") as context:
+            core.discard_local_item(data_key)
+            assert context.get_local_item(data_key) is None
+            core.set_item(data_key, "ban.ana")
+            assert context.get_local_item(data_key) == "ban.ana"
+        assert core.get_item(data_key) is None
+
+    def test_core_add_suppress_exception(self):
+        with core.context_with_data("foobar"):
+            core.add_suppress_exception(KeyError)
+            core.add_suppress_exception(ValueError)
+            raise ValueError("suppressed")
+
+        with pytest.raises(TypeError):
+            with core.context_with_data("foobar"):
+                core.add_suppress_exception(ValueError)
+                raise TypeError("not suppressed")
+
+    def test_core_context_weakref(self):
+        with core.context_with_data("foobar") as context:
+            assert weakref.ref(context)() is context
+
+    def test_core_context_parent_type(self):
+        context = core.ExecutionContext("foobar")
+        with pytest.raises(TypeError):
+            context.parent = "not a context"
+        assert context.parent is None
+
     def test_core_set_item_overwrite_attempt(self):
         data_key = "my.cool.data"
         data_value = "ban.ana2"
@@ -1,6 +1,7 @@
 import pytest
 
 from ddtrace.internal.safety import SafeObjectProxy
+from ddtrace.internal.safety import get_slots
 
 
 class BadError(Exception):
@@ -40,6 +41,17 @@ class UnsafeHashableObject(UnsafeObject):
         return id(self)
 
 
+class SlottedBase(object):
+    __slots__ = ("base_attr", "shared_attr")
+
+
+class SlottedChild(SlottedBase):
+    __slots__ = ("child_attr", "shared_attr")
+
+    def __getattribute__(self, name):
+        unsafe_function()
+
+
 @pytest.mark.parametrize(
     "value",
     [10, 10.0, None, False, "Hello string", b"Hello bytes", 42j],
@@ -82,3 +94,19 @@ def test_safe_dict():
         # For safety reasons we cannot use this form of dict iteration as the
         # keys are safe objects in general.
         assert all(isinstance(safe_dict[_], SafeObjectProxy) for _ in safe_dict)
+
+
+def test_safe_slots_inheritance():
+    obj = SlottedChild()
+    object.__setattr__(obj, "base_attr", 1)
+    object.__setattr__(obj, "child_attr", 2)
+    object.__setattr__(obj, "shared_attr", 3)
+
+    # Slot names are ordered by MRO and de-duplicated
+    assert get_slots(obj) == ("child_attr", "shared_attr", "base_attr")
+
+    safe_obj = SafeObjectProxy.safe(obj)
+    assert isinstance(safe_obj, SafeObjectProxy)
+    assert safe_obj.base_attr == 1
+    assert safe_obj.child_attr == 2
+    assert safe_obj.shared_attr == 3
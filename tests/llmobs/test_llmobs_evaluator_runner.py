@@ -227,6 +227,24 @@ def test_evaluator_sampler_invalid_rule_missing_sample_rate(monkeypatch, mock_ev
         )
 
 
+def test_evaluator_sampler_invalid_rule_null_sample_rate(monkeypatch, mock_evaluator_sampler_logs):
+    monkeypatch.setenv(
+        EvaluatorRunnerSampler.SAMPLING_RULES_ENV_VAR,
+        json.dumps([{"sample_rate": 0.1, "span_name": "dummy"}, {"sample_rate": None, "span_name": "dummy2"}]),
+    )
+
+    with override_global_config({"_raise": True}):
+        with pytest.raises(KeyError):
+            EvaluatorRunnerSampler().rules
+
+    with override_global_config({"_raise": False}):
+        sampling_rules = EvaluatorRunnerSampler().rules
+        assert len(sampling_rules) == 1
+        mock_evaluator_sampler_logs.warning.assert_called_once_with(
+            'sample_rate is not a float for rule: {"sample_rate": null, "span_name": "dummy2"}', exc_info=True
+        )
+
+
 def test_evaluator_runner_sampler_no_rules_samples_all(monkeypatch):
     iterations = int(1e4)
 